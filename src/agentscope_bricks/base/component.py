@@ -238,7 +238,7 @@ class Component(BaseComponent, Generic[ComponentArgsT, ComponentReturnT]):
 
         # Validate the arguments using the Pydantic model
         try:
-            validated_args = args_type(**args_dict)
+            validated_args = args_type.model_validate(args_dict)
         except ValidationError as e:
             raise ValueError(f"Validation error: {e}")
 
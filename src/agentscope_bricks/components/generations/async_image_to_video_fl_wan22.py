@@ -1,18 +1,94 @@
 # -*- coding: utf-8 -*-
 import os
 import uuid
-from http import HTTPStatus
-from typing import Any, Optional
+from typing import Any, Awaitable, Optional
 
-from dashscope.aigc.video_synthesis import AioVideoSynthesis
 from mcp.server.fastmcp import Context
 from pydantic import BaseModel, Field
 
 from agentscope_bricks.base.component import Component
 from agentscope_bricks.utils.tracing_utils.wrapper import trace
-from agentscope_bricks.utils.api_key_util import ApiNames, get_api_key
+from agentscope_bricks.utils.api_key_util import ApiNames, get_cached_api_key
 from agentscope_bricks.utils.tracing_utils import TracingUtil
 
+IMAGE_TO_VIDEO_KF2V_MODEL_NAME = os.getenv(
+    "IMAGE_TO_VIDEO_KF2V_MODEL_NAME",
+    "wan2.2-kf2v-flash",
+)
+
+_TERMINAL_FAILURE = frozenset(("FAILED", "CANCELED"))
+
+_aio_video_synthesis = None
+
+
+def _get_aio_video_synthesis() -> Any:
+    """Return the shared AioVideoSynthesis client, creating it on first use.
+
+    The client only exposes classmethods, so one instance can serve every
+    submit/fetch call of this module.
+    """
+    global _aio_video_synthesis
+    if _aio_video_synthesis is None:
+        from dashscope.aigc.video_synthesis import AioVideoSynthesis
+
+        _aio_video_synthesis = AioVideoSynthesis()
+    return _aio_video_synthesis
+
+
+def _resolve_request_id(*candidates: Optional[str]) -> str:
+    """Return the first non-empty request id, or a freshly generated one."""
+    for candidate in candidates:
+        if candidate:
+            return candidate
+    return uuid.uuid4().hex
+
+
+async def _await_task_call(
+    call: Awaitable[Any],
+    trace_event: Any,
+    trace_key: str,
+    error_message: str,
+    request_id: Optional[str] = None,
+) -> Any:
+    """Await a video-synthesis submit/fetch call, log and check its result.
+
+    Args:
+        call (Awaitable[Any]): The pending ``async_call`` or ``fetch``.
+        trace_event (Any): Trace event to log the response on, if any.
+        trace_key (str): Payload key the response is logged under.
+        error_message (str): Prefix of the error raised on failure.
+        request_id (Optional[str]): Request id to log with the response.
+            Defaults to the id returned by DashScope.
+
+    Returns:
+        Any: The DashScope response, carrying a non-failed task output.
+
+    Raises:
+        RuntimeError: If the call failed or the task failed/was canceled.
+    """
+    response = await call
+
+    if trace_event:
+        trace_event.on_log(
+            "",
+            **{
+                "step_suffix": "results",
+                "payload": {
+                    "request_id": request_id or response.request_id,
+                    trace_key: response,
+                },
+            },
+        )
+
+    if (
+        response.status_code != 200
+        or not response.output
+        or response.output.task_status in _TERMINAL_FAILURE
+    ):
+        raise RuntimeError(f"{error_message}: {response}")
+
+    return response
+
 
 class ImageToVideoByFirstAndLastFrameWan22SubmitInput(BaseModel):
     """
@@ -108,79 +184,55 @@ class ImageToVideoByFirstAndLastFrameWan22Submit(
     async def arun(
         self,
         args: ImageToVideoByFirstAndLastFrameWan22SubmitInput,
+        *,
+        trace_event: Any = None,
         **kwargs: Any,
     ) -> ImageToVideoByFirstAndLastFrameWan22SubmitOutput:
-        trace_event = kwargs.pop("trace_event", None)
         request_id = TracingUtil.get_request_id()
 
         try:
-            api_key = get_api_key(ApiNames.dashscope_api_key, **kwargs)
+            api_key = get_cached_api_key(ApiNames.dashscope_api_key, **kwargs)
         except AssertionError:
             raise ValueError("Please set valid DASHSCOPE_API_KEY!")
 
-        model_name = kwargs.get(
-            "model_name",
-            os.getenv("IMAGE_TO_VIDEO_KF2V_MODEL_NAME", "wan2.2-kf2v-flash"),
-        )
-
-        # 构建 parameters（全部为可选参数）
-        parameters = {}
-        if args.resolution:
-            parameters["resolution"] = args.resolution
-        if args.prompt_extend is not None:
-            parameters["prompt_extend"] = args.prompt_extend
-        if args.watermark is not None:
-            parameters["watermark"] = args.watermark
-        if args.seed is not None:
-            parameters["seed"] = args.seed
-        if args.template:
-            parameters["template"] = args.template
-        aio_video_synthesis = AioVideoSynthesis()
-
-        response = await aio_video_synthesis.async_call(
-            model=model_name,
-            api_key=api_key,
-            first_frame_url=args.first_frame_url,
-            last_frame_url=args.last_frame_url,
-            prompt=args.prompt,
-            negative_prompt=args.negative_prompt,
-            **parameters,
-        )
-
-        if trace_event:
-            trace_event.on_log(
-                "",
-                **{
-                    "step_suffix": "results",
-                    "payload": {
-                        "request_id": request_id,
-                        "submit_task": response,
-                    },
+        model_name = kwargs.get("model_name", IMAGE_TO_VIDEO_KF2V_MODEL_NAME)
+
+        # 构建 parameters（全部为可选参数，空字符串视为未设置）
+        parameters = {
+            name: value
+            for name, value in args.model_dump(
+                exclude_none=True,
+                exclude={
+                    "ctx",
+                    "first_frame_url",
+                    "last_frame_url",
+                    "prompt",
+                    "negative_prompt",
                 },
-            )
-
-        if (
-            response.status_code != HTTPStatus.OK
-            or not response.output
-            or response.output.task_status in ["FAILED", "CANCELED"]
-        ):
-            raise RuntimeError(
-                f"Failed to submit keyframe-to-video task: {response}",
-            )
-
-        if not request_id:
-            request_id = (
-                response.request_id
-                if response.request_id
-                else str(uuid.uuid4())
-            )
-
-        result = ImageToVideoByFirstAndLastFrameWan22SubmitOutput(
+            ).items()
+            if value != ""
+        }
+
+        response = await _await_task_call(
+            _get_aio_video_synthesis().async_call(
+                model=model_name,
+                api_key=api_key,
+                first_frame_url=args.first_frame_url,
+                last_frame_url=args.last_frame_url,
+                prompt=args.prompt,
+                negative_prompt=args.negative_prompt,
+                **parameters,
+            ),
+            trace_event,
+            "submit_task",
+            "Failed to submit keyframe-to-video task",
             request_id=request_id,
+        )
+        return ImageToVideoByFirstAndLastFrameWan22SubmitOutput(
+            request_id=_resolve_request_id(request_id, response.request_id),
             task_id=response.output.task_id,
             task_status=response.output.task_status,
         )
-        return result
 
 
 # ========== Fetch 部分 ==========
@@ -239,49 +291,29 @@ class ImageToVideoByFirstAndLastFrameWan22Fetch(
     async def arun(
         self,
         args: ImageToVideoByFirstAndLastFrameWan22FetchInput,
+        *,
+        trace_event: Any = None,
         **kwargs: Any,
     ) -> ImageToVideoByFirstAndLastFrameWan22FetchOutput:
-        trace_event = kwargs.pop("trace_event", None)
         request_id = TracingUtil.get_request_id()
 
         try:
-            api_key = get_api_key(ApiNames.dashscope_api_key, **kwargs)
+            api_key = get_cached_api_key(ApiNames.dashscope_api_key, **kwargs)
         except AssertionError as e:
             raise ValueError("Please set valid DASHSCOPE_API_KEY!") from e
 
-        aio_video_synthesis = AioVideoSynthesis()
-
-        response = await aio_video_synthesis.fetch(
-            api_key=api_key,
-            task=args.task_id,
+        response = await _await_task_call(
+            _get_aio_video_synthesis().fetch(
+                api_key=api_key,
+                task=args.task_id,
+            ),
+            trace_event,
+            "fetch_result",
+            "Failed to fetch keyframe-to-video result",
         )
-
-        if trace_event:
-            trace_event.on_log(
-                "",
-                **{
-                    "step_suffix": "results",
-                    "payload": {
-                        "request_id": response.request_id,
-                        "fetch_result": response,
-                    },
-                },
-            )
-
-        if (
-            response.status_code != HTTPStatus.OK
-            or not response.output
-            or response.output.task_status in ["FAILED", "CANCELED"]
-        ):
-            raise RuntimeError(
-                f"Failed to fetch keyframe-to-video result: {response}",
-            )
-
-        request_id = response.request_id or request_id or str(uuid.uuid4())
-
         return ImageToVideoByFirstAndLastFrameWan22FetchOutput(
             video_url=response.output.video_url,
             task_id=response.output.task_id,
             task_status=response.output.task_status,
-            request_id=request_id,
+            request_id=_resolve_request_id(response.request_id, request_id),
         )
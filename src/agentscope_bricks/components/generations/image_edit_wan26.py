@@ -1,15 +1,26 @@
 # -*- coding: utf-8 -*-
 import uuid
-from typing import Any, Optional
-from dashscope import AioMultiModalConversation
+from typing import Any, Iterator, Optional
 from mcp.server.fastmcp import Context
 from pydantic import BaseModel, Field
 
 from agentscope_bricks.base.component import Component
 from agentscope_bricks.utils.tracing_utils.wrapper import trace, TraceType
-from agentscope_bricks.utils.api_key_util import ApiNames, get_api_key
+from agentscope_bricks.utils.api_key_util import ApiNames, get_cached_api_key
 from agentscope_bricks.utils.tracing_utils import TracingUtil
 
+_HTTP_PREFIXES = ("http://", "https://")
+
+
+def _iter_images(content: Any) -> Iterator[str]:
+    """Yield image URLs from a message content (list, dict or str)."""
+    for item in content if isinstance(content, list) else (content,):
+        if isinstance(item, dict):
+            if "image" in item:
+                yield item["image"]
+        elif isinstance(item, str) and item.startswith(_HTTP_PREFIXES):
+            yield item
+
 
 class ImageGenInput(BaseModel):
     """
@@ -93,13 +104,14 @@ class ImageEditWan26(
     async def arun(
         self,
         args: ImageGenInput,
+        *,
+        trace_event: Any = None,
         **kwargs: Any,
     ) -> ImageGenOutput:
-        trace_event = kwargs.pop("trace_event", None)
         request_id = TracingUtil.get_request_id()
 
         try:
-            api_key = get_api_key(ApiNames.dashscope_api_key, **kwargs)
+            api_key = get_cached_api_key(ApiNames.dashscope_api_key, **kwargs)
         except AssertionError:
             raise ValueError("Please set valid DASHSCOPE_API_KEY!")
 
@@ -115,19 +127,18 @@ class ImageEditWan26(
                 "content": content,
             },
         ]
-        parameters = {}
-        if args.negative_prompt:
-            parameters["negative_prompt"] = args.negative_prompt
-        if args.size:
-            parameters["size"] = args.size
-        if args.seed is not None:
-            parameters["seed"] = args.seed
-        if args.watermark is not None:
-            parameters["watermark"] = args.watermark
-        if args.prompt_extend is not None:
-            parameters["prompt_extend"] = args.prompt_extend
-        if args.n is not None:
-            parameters["n"] = args.n
+        # Tool callers often send "" for fields they mean to leave unset.
+        parameters = {
+            name: value
+            for name, value in args.model_dump(
+                exclude_none=True,
+                exclude={"ctx", "prompt", "images"},
+            ).items()
+            if value != ""
+        }
+
+        from dashscope import AioMultiModalConversation
+
         try:
             response = await AioMultiModalConversation.call(
                 api_key=api_key,
@@ -144,35 +155,12 @@ class ImageEditWan26(
         if response.status_code != 200 or not response.output:
             raise RuntimeError(f"Wanx 2.6 image generation failed: {response}")
 
-        results = []
-
         try:
-            if hasattr(response, "output") and response.output:
-                choices = getattr(response.output, "choices", [])
-                if choices:
-                    for choice in choices:
-                        message = getattr(choice, "message", {})
-                        msg_content = getattr(message, "content", [])
-                        if isinstance(msg_content, list):
-                            for item in msg_content:
-                                if isinstance(item, dict) and "image" in item:
-                                    results.append(item["image"])
-                                elif isinstance(item, str) and item.startswith(
-                                    ("http://", "https://"),
-                                ):
-                                    results.append(item)
-                        elif isinstance(
-                            msg_content,
-                            str,
-                        ) and msg_content.startswith(
-                            ("http://", "https://"),
-                        ):
-                            results.append(msg_content)
-                        elif (
-                            isinstance(msg_content, dict)
-                            and "image" in msg_content
-                        ):
-                            results.append(msg_content["image"])
+            results = [
+                url
+                for choice in response.output.choices or ()
+                for url in _iter_images(choice.message.content)
+            ]
         except Exception as e:
             raise RuntimeError(
                 f"Failed to parse Wanx 2.6 API response: {str(e)}",
@@ -181,10 +169,7 @@ class ImageEditWan26(
         if not results:
             raise RuntimeError(f"No image found in response: {response}")
 
-        if not request_id:
-            request_id = getattr(response, "request_id", None) or str(
-                uuid.uuid4(),
-            )
+        request_id = request_id or response.request_id or uuid.uuid4().hex
 
         if trace_event:
             trace_event.on_log(
@@ -1,21 +1,117 @@
 # -*- coding: utf-8 -*-
-import uuid
-from typing import Any, Optional
+import asyncio
+import hashlib
+import random
+import secrets
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import aiohttp
 from dashscope import AioMultiModalConversation
 from mcp.server.fastmcp import Context
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from agentscope_bricks.base.component import Component
+from agentscope_bricks.components.generations.image_generation_wan26_cache import (  # noqa: E501
+    ImageGenerationWan26Cache,
+    _request_key,
+)
 from agentscope_bricks.utils.tracing_utils.wrapper import trace, TraceType
-from agentscope_bricks.utils.api_key_util import ApiNames, get_api_key
+from agentscope_bricks.utils.api_key_util import ApiNames, get_cached_api_key
+from agentscope_bricks.utils.logger_util import logger
 from agentscope_bricks.utils.tracing_utils import TracingUtil
 
+# Upper bound of in-flight DashScope calls per component and event loop.
+DEFAULT_MAX_CONCURRENT = 32
+# Attempts per DashScope call, and the base of the exponential backoff.
+# Generation is billed and not idempotent, so retrying is opt-in.
+DEFAULT_MAX_TRIES = 1
+RETRY_BASE_DELAY = 0.25
+# Responses for requests the service rejected before generating anything.
+_RETRYABLE_STATUS = frozenset((429, 503))
+# The service truncates longer prompts, so they are not worth uploading.
+MAX_PROMPT_LENGTH = 800
+MAX_NEGATIVE_PROMPT_LENGTH = 500
+# Inputs that leave every generation parameter at its default.
+_PROMPT_ONLY_FIELDS = frozenset(("prompt", "ctx"))
+
+
+async def _call_with_retry(
+    call: Callable[[], Awaitable[Any]],
+    max_tries: int,
+    base_delay: float,
+) -> Any:
+    """Await ``call()`` until it succeeds or fails terminally.
+
+    Only failures that cannot have started a generation are retried: 429
+    and 503 responses, and connection errors raised before the request was
+    sent. Retries stop after ``max_tries`` attempts in total, sleeping
+    ``base_delay * 2 ** attempt`` plus up to ``base_delay`` of jitter in
+    between. The last attempt's response or exception is passed through.
+    """
+    max_tries = max(max_tries, 1)
+    for attempt in range(max_tries):
+        last = attempt + 1 == max_tries
+        try:
+            response = await call()
+        except aiohttp.ClientConnectorError:
+            if last:
+                raise
+        else:
+            if last or response.status_code not in _RETRYABLE_STATUS:
+                return response
+        await asyncio.sleep(
+            base_delay * 2**attempt + random.uniform(0, base_delay),
+        )
+
+
+def _log_results(
+    trace_event: Any,
+    request_id: str,
+    result: Dict[str, Any],
+) -> None:
+    """Log the results step on the trace event."""
+    trace_event.on_log(
+        "",
+        step_suffix="results",
+        payload={
+            "request_id": request_id,
+            "wanx26_image_generation_result": result,
+        },
+    )
+
+
+def _build_messages(prompt: str) -> List[Dict[str, Any]]:
+    """Build the single-turn user message list for a text prompt."""
+    return [{"role": "user", "content": [{"text": prompt}]}]
+
+
+def _iter_images(content: Any) -> Iterator[str]:
+    """Yield image URLs from a message content (list, dict or str)."""
+    if isinstance(content, str):
+        yield content
+        return
+    for item in content if isinstance(content, list) else (content,):
+        if isinstance(item, dict) and "image" in item:
+            yield item["image"]
+
 
 class ImageGenerationWan26Input(BaseModel):
     """
     Input schema for Wanx 2.6 text-to-image generation.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     prompt: str = Field(
         ...,
         description="正向提示词，描述期望生成的图像内容，建议详细且清晰。超过800字符将被截断。",
@@ -51,6 +147,16 @@ class ImageGenerationWan26Input(BaseModel):
         "MCP internal use only, do not generate it.",
     )
 
+    @field_validator("prompt")
+    @classmethod
+    def _truncate_prompt(cls, v: str) -> str:
+        return v[:MAX_PROMPT_LENGTH]
+
+    @field_validator("negative_prompt")
+    @classmethod
+    def _truncate_negative_prompt(cls, v: Optional[str]) -> Optional[str]:
+        return v[:MAX_NEGATIVE_PROMPT_LENGTH] if v else v
+
 
 class ImageGenerationWan26Output(BaseModel):
     """
@@ -85,58 +191,148 @@ class ImageGenerationWan26(
         "允许在该范围内自由调整宽高比（例如 768×2700）。\n"
     )
 
-    @trace(trace_type=TraceType.AIGC, trace_name="wanx26_image_generation")
-    async def arun(
+    def __init__(
         self,
-        args: ImageGenerationWan26Input,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        cache: Optional[ImageGenerationWan26Cache] = None,
+        max_tries: int = DEFAULT_MAX_TRIES,
         **kwargs: Any,
-    ) -> ImageGenerationWan26Output:
-        trace_event = kwargs.pop("trace_event", None)
-        request_id = TracingUtil.get_request_id()
+    ):
+        """Initialize the Wan 2.6 image generation component.
 
-        try:
-            api_key = get_api_key(ApiNames.dashscope_api_key, **kwargs)
-        except AssertionError:
-            raise ValueError("Please set valid DASHSCOPE_API_KEY!")
+        Args:
+            name: The name of the component.
+            description: The description of the component.
+            max_concurrent: Maximum number of DashScope calls in flight on
+                each event loop; further callers wait for a free slot.
+            cache: Optional result cache. Exact repeats of a request are
+                served from it within its TTL. Disabled by default.
+            max_tries: Attempts per DashScope call. Defaults to 1, i.e. no
+                retries. Above 1, 429/503 responses and failed connections
+                are retried with exponential backoff and jitter. Timeouts
+                and other 5xx responses are never retried, as the service
+                may already have generated, and billed, the images.
+            **kwargs: Other arguments if needed.
+        """
+        super().__init__(name=name, description=description, **kwargs)
+        self.max_concurrent = max_concurrent
+        self.cache = cache
+        self.max_tries = max_tries
+        self._in_flight: Dict[
+            Tuple[asyncio.AbstractEventLoop, bytes],
+            asyncio.Task,
+        ] = {}
+        # asyncio semaphores are bound to the loop they are first used on.
+        self._semaphores: Dict[
+            asyncio.AbstractEventLoop,
+            asyncio.Semaphore,
+        ] = {}
 
-        model_name = "wan2.6-t2i"
-        messages = [
-            {
-                "role": "user",
-                "content": [{"text": args.prompt}],
-            },
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # A contended semaphore references its loop, so weak keys would
+            # never expire; drop the limiters of closed loops instead.
+            for stale in [key for key in self._semaphores if key.is_closed()]:
+                del self._semaphores[stale]
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def warmup(
+        self,
+        prompts: List[Union[str, ImageGenerationWan26Input]],
+        **kwargs: Any,
+    ) -> None:
+        """Generate images for known hot prompts to pre-populate the cache.
+
+        Requests run concurrently, bounded by ``max_concurrent``; failures
+        are logged and skipped.
+
+        Args:
+            prompts: Prompts or full inputs to generate.
+            **kwargs: Other arguments passed to :meth:`arun`.
+
+        Raises:
+            ValueError: If the component has no cache configured.
+        """
+        if self.cache is None:
+            raise ValueError("Warmup requires a cache to populate.")
+        inputs = [
+            (
+                ImageGenerationWan26Input(prompt=prompt)
+                if isinstance(prompt, str)
+                else prompt
+            )
+            for prompt in prompts
         ]
+        outcomes = await asyncio.gather(
+            *(self.arun(args, **kwargs) for args in inputs),
+            return_exceptions=True,
+        )
+        for args, outcome in zip(inputs, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    f"Failed to warm up prompt {args.prompt!r}: {outcome}",
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics and the number of coalesced calls in
+        flight.
+
+        Returns:
+            Dict[str, Any]: The cache's :meth:`ImageGenerationWan26Cache.stats`
+                (empty without a cache) plus an ``in_flight`` count.
+        """
+        stats = self.cache.stats() if self.cache is not None else {}
+        stats["in_flight"] = len(self._in_flight)
+        return stats
+
+    async def _generate(
+        self,
+        args: ImageGenerationWan26Input,
+        api_key: str,
+    ) -> Tuple[Any, List[str]]:
+        """Call DashScope and return the response with its image URLs."""
+        model_name = "wan2.6-t2i"
+        messages = _build_messages(args.prompt)
+
+        if args.model_fields_set <= _PROMPT_ONLY_FIELDS:
+            # Most requests only set the prompt, leaving n at its default.
+            parameters = {"n": args.n}
+        else:
+            parameters = {
+                name: value
+                for name, value in (
+                    ("negative_prompt", args.negative_prompt or None),
+                    ("size", args.size or None),
+                    ("n", args.n),
+                    ("seed", args.seed),
+                    ("watermark", args.watermark),
+                    ("prompt_extend", args.prompt_extend),
+                )
+                if value is not None
+            }
 
-        # Normalize watermark
-        if args.watermark is not None:
-            if isinstance(args.watermark, str):
-                args.watermark = args.watermark.strip().lower() in (
-                    "true",
-                    "1",
+        async def call() -> Any:
+            # Hold a slot per attempt only, not while backing off.
+            async with self._get_semaphore():
+                return await AioMultiModalConversation.call(
+                    api_key=api_key,
+                    model=model_name,
+                    messages=messages,
+                    **parameters,
                 )
-            else:
-                args.watermark = bool(args.watermark)
-
-        parameters = {}
-        if args.negative_prompt:
-            parameters["negative_prompt"] = args.negative_prompt
-        if args.size:
-            parameters["size"] = args.size
-        if args.n is not None:
-            parameters["n"] = args.n
-        if args.seed is not None:
-            parameters["seed"] = args.seed
-        if args.watermark is not None:
-            parameters["watermark"] = args.watermark
-        if args.prompt_extend is not None:
-            parameters["prompt_extend"] = args.prompt_extend
 
         try:
-            response = await AioMultiModalConversation.call(
-                api_key=api_key,
-                model=model_name,
-                messages=messages,
-                **parameters,
+            response = await _call_with_retry(
+                call,
+                self.max_tries,
+                RETRY_BASE_DELAY,
             )
         except Exception as e:
             raise RuntimeError(
@@ -146,21 +342,12 @@ class ImageGenerationWan26(
         if response.status_code != 200 or not response.output:
             raise RuntimeError(f"Wan 2.6 image generation failed: {response}")
 
-        results = []
         try:
-            if hasattr(response, "output") and response.output:
-                choices = getattr(response.output, "choices", [])
-                for choice in choices:
-                    message = getattr(choice, "message", {})
-                    content = getattr(message, "content", [])
-                    if isinstance(content, list):
-                        for item in content:
-                            if isinstance(item, dict) and "image" in item:
-                                results.append(item["image"])
-                    elif isinstance(content, str):
-                        results.append(content)
-                    elif isinstance(content, dict) and "image" in content:
-                        results.append(content["image"])
+            results = [
+                url
+                for choice in response.output.choices or ()
+                for url in _iter_images(choice.message.content)
+            ]
         except Exception as e:
             raise RuntimeError(
                 f"Failed to parse Wan 2.6 API response: {str(e)}",
@@ -169,24 +356,80 @@ class ImageGenerationWan26(
         if not results:
             raise RuntimeError(f"No image URLs found in response: {response}")
 
+        return response, results
+
+    @trace(trace_type=TraceType.AIGC, trace_name="wanx26_image_generation")
+    async def arun(
+        self,
+        args: ImageGenerationWan26Input,
+        *,
+        trace_event: Any = None,
+        **kwargs: Any,
+    ) -> ImageGenerationWan26Output:
+        request_id = TracingUtil.get_request_id()
+
+        try:
+            api_key = get_cached_api_key(ApiNames.dashscope_api_key, **kwargs)
+        except AssertionError:
+            raise ValueError("Please set valid DASHSCOPE_API_KEY!")
+
+        # Results, cached or in flight, are only shared between callers
+        # with the same API key.
+        cache_params = (
+            hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest(),
+            args.negative_prompt,
+            args.size,
+            args.n,
+            args.seed,
+            args.watermark,
+            args.prompt_extend,
+        )
+        if self.cache is not None:
+            cached = await self.cache.aget(args.prompt, cache_params)
+            if cached is not None:
+                request_id = request_id or secrets.token_hex(16)
+                if trace_event:
+                    _log_results(
+                        trace_event,
+                        request_id,
+                        {"cache_hit": True, "results": cached},
+                    )
+                return ImageGenerationWan26Output(
+                    results=cached,
+                    request_id=request_id,
+                )
+
+        key = None
+        if self.cache is not None or args.seed is not None:
+            # Identical requests in flight share a single DashScope call:
+            # seeded ones are deterministic, and with a cache configured
+            # identical requests already share results.
+            loop = asyncio.get_running_loop()
+            key = (loop, _request_key(args.prompt, cache_params))
+            task = self._in_flight.get(key)
+            if task is None:
+                task = loop.create_task(self._generate(args, api_key))
+                self._in_flight[key] = task
+                task.add_done_callback(
+                    lambda _: self._in_flight.pop(key, None),
+                )
+            # Shield the shared call from cancellation of any one caller.
+            response, results = await asyncio.shield(task)
+        else:
+            response, results = await self._generate(args, api_key)
+
+        if self.cache is not None:
+            self.cache.put(args.prompt, cache_params, results)
+
         if not request_id:
-            request_id = getattr(response, "request_id", None) or str(
-                uuid.uuid4(),
-            )
+            request_id = getattr(response, "request_id", None)
+        request_id = request_id or secrets.token_hex(16)
 
         if trace_event:
-            trace_event.on_log(
-                "",
-                **{
-                    "step_suffix": "results",
-                    "payload": {
-                        "request_id": request_id,
-                        "wanx26_image_generation_result": {
-                            "status_code": response.status_code,
-                            "results": results,
-                        },
-                    },
-                },
+            _log_results(
+                trace_event,
+                request_id,
+                {"status_code": response.status_code, "results": results},
             )
 
         return ImageGenerationWan26Output(
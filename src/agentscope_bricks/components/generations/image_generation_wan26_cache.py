@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Tuple
+
+from agentscope_bricks.utils.logger_util import logger
+
+
+def _normalize_prompt(prompt: str) -> str:
+    # Case is kept: wan2.6 renders quoted text into the image verbatim.
+    return " ".join(prompt.split())
+
+
+def _request_key(prompt: str, params: Tuple) -> bytes:
+    """Digest of the canonical JSON of a normalized request."""
+    canonical = json.dumps(
+        [_normalize_prompt(prompt), list(params)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+class ImageGenerationWan26Cache:
+    """
+    Exact-match cache of Wan 2.6 image generation results.
+
+    Entries are keyed by a digest of the canonicalized request and expire
+    after ``ttl`` seconds. They are kept in a bounded in-memory LRU. With
+    a ``path``, entries are also persisted to SQLite so they survive
+    restarts and can be shared between worker processes; that tier is only
+    consulted by :meth:`aget`, and is read and written on a small dedicated
+    thread pool with one connection per thread.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 3600,
+        path: Optional[str] = None,
+        disk_timeout: float = 0.05,
+        disk_workers: int = 2,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory.
+            ttl: Seconds an entry, in memory or on disk, stays valid.
+            path: Optional SQLite database file for the persistent tier.
+            disk_timeout: Seconds to wait for a persistent-tier read before
+                treating it as a miss.
+            disk_workers: Threads serving the persistent tier. When all of
+                them are busy, lookups skip the disk instead of queueing.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self.disk_timeout = disk_timeout
+        self.disk_workers = disk_workers
+        self._entries: "OrderedDict[bytes, Tuple[float, List[str]]]" = (
+            OrderedDict()
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Each disk thread has its own connection, so WAL readers do not
+        # wait on each other.
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # Reads still running, including those a timed-out caller abandoned.
+        self._read_slots = threading.BoundedSemaphore(disk_workers)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if path is not None:
+            # Create the schema up front so the first lookup does not pay
+            # for it within disk_timeout.
+            with closing(sqlite3.connect(path)) as db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS image_cache ("
+                    "key BLOB PRIMARY KEY, results TEXT NOT NULL, "
+                    "ts REAL NOT NULL)",
+                )
+                db.commit()
+
+    def _lookup(self, key: bytes) -> Optional[List[str]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[1])
+            del self._entries[key]
+        return None
+
+    def get(self, prompt: str, params: Tuple) -> Optional[List[str]]:
+        """Return cached results for the request from memory, if any.
+
+        Args:
+            prompt: The prompt to look up.
+            params: JSON-serializable tuple of the remaining generation
+                parameters.
+
+        Returns:
+            Optional[List[str]]: The cached image URLs, or None on a miss.
+        """
+        results = self._lookup(_request_key(prompt, params))
+        if results is None:
+            self.misses += 1
+        return results
+
+    async def aget(self, prompt: str, params: Tuple) -> Optional[List[str]]:
+        """Like :meth:`get`, but fall back to the persistent tier on a
+        memory miss. Disk hits are promoted to memory.
+
+        Args:
+            prompt: The prompt to look up.
+            params: JSON-serializable tuple of the remaining generation
+                parameters.
+
+        Returns:
+            Optional[List[str]]: The cached image URLs, or None on a miss.
+        """
+        key = _request_key(prompt, params)
+        results = self._lookup(key)
+        if (
+            results is None
+            and self.path is not None
+            and self._read_slots.acquire(blocking=False)
+        ):
+            future = self._get_executor().submit(self._disk_get, key)
+            future.add_done_callback(lambda _: self._read_slots.release())
+            try:
+                row = await asyncio.wait_for(
+                    asyncio.wrap_future(future),
+                    timeout=self.disk_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.debug(f"Timed out reading image cache {self.path}")
+                row = None
+            except Exception as e:
+                logger.warning(f"Failed to read image cache {self.path}: {e}")
+                row = None
+            if row is not None:
+                results, remaining = row
+                self._put_memory(key, results, remaining)
+                self.disk_hits += 1
+        if results is None:
+            self.misses += 1
+        return results
+
+    def _put_memory(self, key: bytes, results: List[str], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, list(results))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def put(self, prompt: str, params: Tuple, results: List[str]) -> None:
+        """Store the results generated for a request.
+
+        The persistent-tier write happens on the cache's disk threads, off
+        the caller's path.
+
+        Args:
+            prompt: The prompt the results were generated for.
+            params: JSON-serializable tuple of the remaining generation
+                parameters.
+            results: The generated image URLs.
+        """
+        key = _request_key(prompt, params)
+        self._put_memory(key, results, self.ttl)
+        if self.path is not None:
+            future = self._get_executor().submit(
+                self._disk_put,
+                key,
+                list(results),
+                time.time(),
+            )
+            future.add_done_callback(self._log_disk_error)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.disk_workers,
+                    thread_name_prefix="image-cache",
+                )
+            return self._executor
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            self._local.db = db
+            with self._lock:
+                self._connections.append(db)
+        return db
+
+    def _disk_get(self, key: bytes) -> Optional[Tuple[List[str], float]]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT results, ts FROM image_cache WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        remaining = row[1] + self.ttl - time.time()
+        if remaining <= 0:
+            return None
+        return json.loads(row[0]), remaining
+
+    def _disk_put(self, key: bytes, results: List[str], ts: float) -> None:
+        db = self._connection()
+        db.execute(
+            "INSERT OR REPLACE INTO image_cache (key, results, ts) "
+            "VALUES (?, ?, ?)",
+            (key, json.dumps(results), ts),
+        )
+        db.commit()
+
+    def _log_disk_error(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(
+                f"Failed to write image cache {self.path}: "
+                f"{future.exception()}",
+            )
+
+    def close(self) -> None:
+        """Wait for pending disk writes and close the persistent tier's
+        threads and database connections."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            for db in self._connections:
+                db.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache size and hit counters.
+
+        Returns:
+            Dict[str, Any]: The in-memory entry count, memory and disk
+                hits, misses and the overall hit rate.
+        """
+        hits = self.hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
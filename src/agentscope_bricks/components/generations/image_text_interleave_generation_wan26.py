@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import uuid
 import json
-from http import HTTPStatus
 from typing import Any, Optional, Dict, AsyncGenerator
 import aiohttp
 from mcp.server.fastmcp import Context
@@ -12,8 +11,20 @@ from agentscope_bricks.utils.tracing_utils.wrapper import trace
 from agentscope_bricks.utils.api_key_util import ApiNames, get_api_key
 from agentscope_bricks.utils.tracing_utils import TracingUtil
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 DASHSCOPE_API_BASE = "https://dashscope.aliyuncs.com/api/v1"
+_MAX_ERROR_BODY_SIZE = 64 * 1024
 
 
 class WanImageInterleaveGenerationInput(BaseModel):
@@ -139,10 +150,18 @@ class WanImageInterleaveGeneration(
             async with session.post(
                 f"{DASHSCOPE_API_BASE}/services/aigc/multimodal-generation/generation",  # noqa
                 headers=headers,
-                json=payload,
+                data=_json_dumps(payload),
             ) as resp:
-                if resp.status != HTTPStatus.OK:
-                    error_text = await resp.text()
+                if resp.status != 200:
+                    # Error bodies are small JSON documents; skip anything
+                    # that announces itself as larger than that.
+                    if (resp.content_length or 0) > _MAX_ERROR_BODY_SIZE:
+                        error_text = f"HTTP {resp.status}"
+                    else:
+                        error_text = (await resp.read()).decode(
+                            "utf-8",
+                            "replace",
+                        )
                     raise RuntimeError(f"SSE request failed: {error_text}")
 
                 async for line_bytes in resp.content:
@@ -155,7 +174,7 @@ class WanImageInterleaveGeneration(
                         break
 
                     try:
-                        chunk = json.loads(data_str)
+                        chunk = _json_loads(data_str)
                         contents = chunk["output"]["choices"][0]["message"][
                             "content"
                         ]
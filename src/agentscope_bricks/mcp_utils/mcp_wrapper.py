@@ -151,7 +151,7 @@ async def {func_name}({args_str}):
             kwargs_dict[param_name] = param_value
         # Skip optional fields with None values - let Pydantic use defaults
 
-    input_model = component.input_type(**kwargs_dict)
+    input_model = component.input_type.model_validate(kwargs_dict)
 
     # Set request_id from MCP context before calling component method
     if 'ctx' in locals_dict and locals_dict['ctx'] is not None:
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 
 
@@ -43,3 +44,32 @@ def get_api_key(
 
     assert api_key != "", f"{api_enum.name} must be acquired"
     return api_key
+
+
+@lru_cache(maxsize=32)
+def _get_api_key_cached(api_enum: ApiNames) -> str:
+    return get_api_key(api_enum)
+
+
+def get_cached_api_key(api_enum: ApiNames, **kwargs: Any) -> str:
+    """Get API key like :func:`get_api_key`, caching the lookup for the
+    lifetime of the process.
+
+    A key passed through kwargs always takes precedence and bypasses the
+    cache, so a runtime override is never shadowed by a previously cached
+    environment value. Failed lookups are not cached.
+
+    Args:
+        api_enum (ApiNames): Enum of API name to retrieve.
+        **kwargs (Any): Additional keyword arguments that might contain the
+                API key.
+
+    Returns:
+        str: The API key value.
+
+    Raises:
+        AssertionError: If no API key is found from any source.
+    """
+    if api_enum.name in kwargs:
+        return get_api_key(api_enum, **kwargs)
+    return _get_api_key_cached(api_enum)
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for Wan 2.6 image generation and its result cache."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+
+from agentscope_bricks.components.generations import image_generation_wan26
+from agentscope_bricks.components.generations.image_generation_wan26 import (
+    ImageGenerationWan26,
+    ImageGenerationWan26Input,
+    _call_with_retry,
+)
+from agentscope_bricks.components.generations.image_generation_wan26_cache import (  # noqa: E501
+    ImageGenerationWan26Cache,
+)
+from agentscope_bricks.utils.api_key_util import _get_api_key_cached
+
+
+def _response(url, status_code=200):
+    return SimpleNamespace(
+        status_code=status_code,
+        request_id="req",
+        output=SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content=[{"image": url}]),
+                ),
+            ],
+        ),
+    )
+
+
+@pytest.fixture
+def fake_call(monkeypatch):
+    """Replace the DashScope call with a slow fake recording its kwargs."""
+    calls = []
+
+    async def call(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.05)
+        return _response(f"http://img/{len(calls)}")
+
+    monkeypatch.setattr(
+        image_generation_wan26.AioMultiModalConversation,
+        "call",
+        call,
+    )
+    return calls
+
+
+def test_cache_matches_normalized_prompt():
+    cache = ImageGenerationWan26Cache()
+    cache.put("a red cat", (), ["http://img/cat"])
+
+    assert cache.get(" a  red\ncat ", ()) == ["http://img/cat"]
+    assert cache.get("a red cat.", ()) is None
+
+
+def test_cache_keeps_prompt_case():
+    cache = ImageGenerationWan26Cache()
+    cache.put('a sign saying "OPEN"', (), ["http://img/upper"])
+
+    assert cache.get('a sign saying "open"', ()) is None
+
+
+def test_cache_requires_identical_params():
+    cache = ImageGenerationWan26Cache()
+    cache.put("a red cat on a sofa", ("1280*1280", 1), ["http://img/1"])
+
+    assert cache.get("a red cat on a sofa", ("1280*1280", 2)) is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ImageGenerationWan26Cache(maxsize=2)
+    cache.put("a red cat", (), ["http://img/cat"])
+    cache.put("a blue dog", (), ["http://img/dog"])
+    cache.get("a red cat", ())
+    cache.put("a green frog", (), ["http://img/frog"])
+
+    assert cache.get("a red cat", ()) == ["http://img/cat"]
+    assert cache.get("a blue dog", ()) is None
+
+
+def test_cache_entries_expire():
+    cache = ImageGenerationWan26Cache(ttl=0)
+    cache.put("a red cat", (), ["http://img/cat"])
+
+    assert cache.get("a red cat", ()) is None
+
+
+def test_cache_stats_counts_hits_and_misses():
+    cache = ImageGenerationWan26Cache()
+    cache.put("a red cat on a sofa", (1,), ["http://img/1"])
+    cache.get("a red cat on a sofa", (1,))
+    cache.get("a blue dog", (1,))
+
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 1 / 2
+
+
+def test_cache_persists_entries(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ImageGenerationWan26Cache(path=path)
+    assert (tmp_path / "cache.db").exists()
+    cache.put("a red cat", (1,), ["http://img/cat"])
+    cache.close()
+
+    restored = ImageGenerationWan26Cache(path=path)
+    assert restored.get("a red cat", (1,)) is None
+    assert asyncio.run(restored.aget("a red cat", (1,))) == [
+        "http://img/cat",
+    ]
+    assert restored.get("a red cat", (1,)) == ["http://img/cat"]
+    assert restored.stats()["disk_hits"] == 1
+    restored.close()
+
+
+def test_cache_skips_disk_while_workers_are_busy(tmp_path, monkeypatch):
+    cache = ImageGenerationWan26Cache(
+        path=str(tmp_path / "cache.db"),
+        disk_timeout=0.01,
+        disk_workers=1,
+    )
+    release = threading.Event()
+    reads = []
+
+    def blocked_read(key):
+        reads.append(key)
+        release.wait()
+
+    monkeypatch.setattr(cache, "_disk_get", blocked_read)
+    assert asyncio.run(cache.aget("a red cat", (1,))) is None
+    assert asyncio.run(cache.aget("a blue dog", (1,))) is None
+    assert len(reads) == 1
+    assert cache.stats()["misses"] == 2
+
+    release.set()
+    cache.close()
+
+
+def test_concurrent_seeded_requests_share_one_call(fake_call):
+    component = ImageGenerationWan26()
+    args = ImageGenerationWan26Input(prompt="a red cat", seed=1)
+
+    async def main():
+        return await asyncio.gather(
+            *(component.arun(args, dashscope_api_key="A") for _ in range(3)),
+        )
+
+    outputs = asyncio.run(main())
+    assert len(fake_call) == 1
+    assert [output.results for output in outputs] == [["http://img/1"]] * 3
+    assert component.stats()["in_flight"] == 0
+
+
+def test_unseeded_requests_are_not_shared(fake_call):
+    component = ImageGenerationWan26()
+    args = ImageGenerationWan26Input(prompt="a red cat")
+
+    async def main():
+        await asyncio.gather(
+            *(component.arun(args, dashscope_api_key="A") for _ in range(2)),
+        )
+
+    asyncio.run(main())
+    assert len(fake_call) == 2
+
+
+def test_requests_with_different_api_keys_are_not_shared(fake_call):
+    component = ImageGenerationWan26()
+    args = ImageGenerationWan26Input(prompt="a red cat", seed=1)
+
+    async def main():
+        await asyncio.gather(
+            component.arun(args, dashscope_api_key="A"),
+            component.arun(args, dashscope_api_key="B"),
+        )
+
+    asyncio.run(main())
+    assert sorted(call["api_key"] for call in fake_call) == ["A", "B"]
+
+
+def test_cancelled_caller_does_not_cancel_shared_call(fake_call):
+    component = ImageGenerationWan26()
+    args = ImageGenerationWan26Input(prompt="a red cat", seed=1)
+
+    async def main():
+        first = asyncio.create_task(
+            component.arun(args, dashscope_api_key="A"),
+        )
+        second = asyncio.create_task(
+            component.arun(args, dashscope_api_key="A"),
+        )
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, asyncio.CancelledError)
+    assert second.results == ["http://img/1"]
+    assert len(fake_call) == 1
+
+
+def test_cached_results_are_scoped_to_the_api_key(fake_call, monkeypatch):
+    monkeypatch.delenv("DASHSCOPE_API_KEY", raising=False)
+    _get_api_key_cached.cache_clear()
+    component = ImageGenerationWan26(cache=ImageGenerationWan26Cache())
+    args = ImageGenerationWan26Input(prompt="a red cat", seed=1)
+
+    first = asyncio.run(component.arun(args, dashscope_api_key="A"))
+    second = asyncio.run(component.arun(args, dashscope_api_key="B"))
+    assert first.results != second.results
+    assert [call["api_key"] for call in fake_call] == ["A", "B"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(component.arun(args))
+    assert len(fake_call) == 2
+
+
+def test_persisted_results_are_scoped_to_the_api_key(fake_call, tmp_path):
+    path = str(tmp_path / "cache.db")
+    args = ImageGenerationWan26Input(prompt="a red cat", seed=1)
+    writer = ImageGenerationWan26(cache=ImageGenerationWan26Cache(path=path))
+    asyncio.run(writer.arun(args, dashscope_api_key="A"))
+    writer.cache.close()
+
+    reader = ImageGenerationWan26(cache=ImageGenerationWan26Cache(path=path))
+    asyncio.run(reader.arun(args, dashscope_api_key="B"))
+    assert len(fake_call) == 2
+    asyncio.run(reader.arun(args, dashscope_api_key="A"))
+    assert len(fake_call) == 2
+    assert reader.stats()["disk_hits"] == 1
+    reader.cache.close()
+
+
+def test_warmup_populates_the_cache(fake_call):
+    component = ImageGenerationWan26(cache=ImageGenerationWan26Cache())
+
+    asyncio.run(
+        component.warmup(["a red cat", "a blue dog"], dashscope_api_key="A"),
+    )
+    assert len(fake_call) == 2
+    stats = component.stats()
+    assert stats["size"] == 2
+    assert stats["misses"] == 2
+    assert stats["in_flight"] == 0
+
+    args = ImageGenerationWan26Input(prompt="a red cat")
+    asyncio.run(component.arun(args, dashscope_api_key="A"))
+    assert len(fake_call) == 2
+    assert component.stats()["hits"] == 1
+
+
+def _scripted_call(outcomes):
+    """Return a fake call yielding the given responses or exceptions."""
+    attempts = []
+
+    async def call():
+        outcome = outcomes[len(attempts)]
+        attempts.append(outcome)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return call, attempts
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_retry_on_retryable_status(status_code):
+    call, attempts = _scripted_call(
+        [_response("", status_code), _response("http://img/ok")],
+    )
+
+    response = asyncio.run(_call_with_retry(call, 3, 0))
+    assert response.status_code == 200
+    assert len(attempts) == 2
+
+
+def test_retry_passes_through_last_response():
+    call, attempts = _scripted_call([_response("", 503)] * 3)
+
+    response = asyncio.run(_call_with_retry(call, 3, 0))
+    assert response.status_code == 503
+    assert len(attempts) == 3
+
+
+def test_retry_reraises_last_exception():
+    error = aiohttp.ClientConnectorError(
+        SimpleNamespace(host="dashscope", port=443, ssl=True),
+        OSError("connection refused"),
+    )
+    call, attempts = _scripted_call([error, error])
+
+    with pytest.raises(aiohttp.ClientConnectorError):
+        asyncio.run(_call_with_retry(call, 2, 0))
+    assert len(attempts) == 2
+
+
+@pytest.mark.parametrize("status_code", [400, 500, 502, 504])
+def test_retry_does_not_retry_possibly_billed_responses(status_code):
+    call, attempts = _scripted_call([_response("", status_code)])
+
+    response = asyncio.run(_call_with_retry(call, 3, 0))
+    assert response.status_code == status_code
+    assert len(attempts) == 1
+
+
+def test_retry_does_not_retry_timeouts():
+    call, attempts = _scripted_call([asyncio.TimeoutError()])
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_call_with_retry(call, 3, 0))
+    assert len(attempts) == 1
+
+
+def test_retry_is_off_by_default(fake_call, monkeypatch):
+    async def call(**kwargs):
+        fake_call.append(kwargs)
+        return _response("", 429)
+
+    monkeypatch.setattr(
+        image_generation_wan26.AioMultiModalConversation,
+        "call",
+        call,
+    )
+    args = ImageGenerationWan26Input(prompt="a red cat")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            ImageGenerationWan26().arun(args, dashscope_api_key="A"),
+        )
+    assert len(fake_call) == 1